@@ -2,10 +2,392 @@
 
 from __future__ import annotations
 
+import asyncio
+import logging
+import re
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any
 
-from neo4j import AsyncGraphDatabase, AsyncDriver, NotificationDisabledCategory
+from neo4j import (
+    AsyncDriver,
+    AsyncGraphDatabase,
+    AsyncManagedTransaction,
+    AsyncSession,
+    READ_ACCESS,
+    NotificationDisabledCategory,
+    Record,
+    RoutingControl,
+)
+from neo4j.exceptions import ClientError, Neo4jError
+
+logger = logging.getLogger(__name__)
+
+# Characters with special meaning in Lucene query syntax.
+_RE_LUCENE_SPECIAL = re.compile(r'([+\-&|!(){}\[\]^"~*?:\\/])')
+# Upper-case boolean operators; the analyzer lower-cases terms anyway.
+_RE_LUCENE_OPERATOR = re.compile(r"\b(AND|OR|NOT)\b")
+
+
+def _escape_lucene(text: str) -> str:
+    """Escape Lucene special characters so user text is matched literally."""
+    text = _RE_LUCENE_OPERATOR.sub(lambda m: m.group(1).lower(), text)
+    return _RE_LUCENE_SPECIAL.sub(r"\\\1", text)
+
+
+# Any non-word character; Unicode-aware, so non-Latin types survive.
+_RE_REL = re.compile(r"\W")
+
+
+@lru_cache(maxsize=256)
+def _safe_rel_type(relation_type: str) -> str:
+    """Normalise a relationship type to upper case with non-word characters as ``_``."""
+    return _RE_REL.sub("_", relation_type.upper())
+
+
+# ── Cypher ────────────────────────────────────────────────────────────
+
+_Q_CREATE_ENTITY = """
+MERGE (e:Entity {name: $name, project: $project})
+ON CREATE SET
+    e.type = $entity_type,
+    e.observations = apoc.coll.toSet($observations),
+    e.created_at = datetime(),
+    e.updated_at = datetime()
+ON MATCH SET
+    e.type = $entity_type,
+    e.observations = apoc.coll.toSet(coalesce(e.observations, []) + $observations),
+    e.updated_at = datetime()
+SET e += $properties
+RETURN e{.*, labels: labels(e)} AS entity
+"""
+
+_Q_CREATE_ENTITIES = """
+UNWIND $rows AS r
+MERGE (e:Entity {name: r.name, project: r.project})
+ON CREATE SET
+    e.type = r.type,
+    e.observations = apoc.coll.toSet(r.observations),
+    e.created_at = datetime(),
+    e.updated_at = datetime()
+ON MATCH SET
+    e.type = r.type,
+    e.observations = apoc.coll.toSet(coalesce(e.observations, []) + r.observations),
+    e.updated_at = datetime()
+SET e += r.properties
+RETURN e{.*, labels: labels(e)} AS entity
+"""
+
+_Q_ADD_OBS = """
+MATCH (e:Entity {name: $name, project: $project})
+SET e.observations = apoc.coll.toSet(coalesce(e.observations, []) + $observations),
+    e.updated_at = datetime()
+RETURN e{.*, labels: labels(e)} AS entity
+"""
+
+_Q_DELETE_ENTITY = """
+MATCH (e:Entity {name: $name, project: $project})
+DETACH DELETE e
+RETURN count(e) AS deleted
+"""
+
+# Relationship types cannot be Cypher parameters, so these go through APOC
+# to keep the query text (and its cached plan) independent of the type.
+_Q_CREATE_RELATIONSHIP = """
+MATCH (a:Entity {name: $from_name, project: $project})
+MATCH (b:Entity {name: $to_name, project: $project})
+CALL apoc.merge.relationship(a, $rel_type, {}, {}, b, {}) YIELD rel
+SET rel += $properties, rel.created_at = coalesce(rel.created_at, datetime())
+RETURN type(rel) AS type,
+       a.name AS from, b.name AS to,
+       properties(rel) AS properties
+"""
+
+_Q_CREATE_RELATIONSHIPS = """
+UNWIND $rows AS row
+MATCH (a:Entity {name: row.from_name, project: row.project})
+MATCH (b:Entity {name: row.to_name, project: row.project})
+CALL apoc.merge.relationship(a, row.rel_type, {}, {}, b, {}) YIELD rel
+SET rel += row.properties, rel.created_at = coalesce(rel.created_at, datetime())
+RETURN type(rel) AS type,
+       a.name AS from, b.name AS to,
+       properties(rel) AS properties
+"""
+
+_Q_DELETE_RELATIONSHIP = """
+MATCH (a:Entity {name: $from_name, project: $project})
+      -[r]->
+      (b:Entity {name: $to_name, project: $project})
+WHERE type(r) = $rel_type
+DELETE r
+RETURN count(r) AS deleted
+"""
+
+_Q_GET_ENTITY = """
+MATCH (e:Entity {name: $name, project: $project})
+CALL {
+    WITH e
+    MATCH (e)-[r]->(target:Entity)
+    RETURN collect({type: type(r), target: target.name, target_type: target.type}) AS outgoing
+}
+CALL {
+    WITH e
+    MATCH (source:Entity)-[ri]->(e)
+    RETURN collect({type: type(ri), source: source.name, source_type: source.type}) AS incoming
+}
+RETURN e{.*, labels: labels(e)} AS entity,
+       outgoing AS outgoing_relations,
+       incoming AS incoming_relations
+"""
+
+_Q_SEARCH = """
+CALL db.index.fulltext.queryNodes('entity_fulltext', $query)
+YIELD node AS e, score
+WHERE $project IS NULL OR e.project = $project
+RETURN e{.*, labels: labels(e)} AS entity
+ORDER BY score DESC
+SKIP $offset
+LIMIT $limit
+"""
+
+# Project graph pages are keyed on entity name: a page holds the first
+# $limit entities after $after_name and their outgoing relationships.
+# The first page and later pages are separate queries so that later
+# pages plan a range seek on (project, name) rather than a filter over
+# the whole project, which `$after_name IS NULL OR ...` would force.
+_Q_PROJECT_ENTITIES = """
+MATCH (e:Entity {project: $project})
+RETURN e{.name, .type, .observations} AS entity
+ORDER BY e.name
+LIMIT $limit
+"""
+
+_Q_PROJECT_ENTITIES_AFTER = """
+MATCH (e:Entity {project: $project})
+WHERE e.name > $after_name
+RETURN e{.name, .type, .observations} AS entity
+ORDER BY e.name
+LIMIT $limit
+"""
+
+_Q_PROJECT_RELATIONSHIPS = """
+MATCH (e:Entity {project: $project})
+WITH e ORDER BY e.name LIMIT $limit
+MATCH (e)-[r]->(t:Entity {project: $project})
+RETURN {from: e.name, to: t.name, type: type(r)} AS relationship
+"""
+
+_Q_PROJECT_RELATIONSHIPS_AFTER = """
+MATCH (e:Entity {project: $project})
+WHERE e.name > $after_name
+WITH e ORDER BY e.name LIMIT $limit
+MATCH (e)-[r]->(t:Entity {project: $project})
+RETURN {from: e.name, to: t.name, type: type(r)} AS relationship
+"""
+
+_Q_LIST_PROJECTS = """
+MATCH (e:Entity)
+RETURN DISTINCT e.project AS project
+ORDER BY project
+"""
+
+_Q_ADD_MIGRATION = """
+MATCH (latest:Migration {project: $project})
+WITH max(latest.seq) AS max_seq
+WITH coalesce(max_seq, 0) + 1 AS next_seq
+CREATE (m:Migration {
+    project: $project,
+    seq: next_seq,
+    version: coalesce($version, toString(next_seq)),
+    description: $description,
+    cypher_up: $cypher_up,
+    cypher_down: $cypher_down,
+    created_at: datetime(),
+    applied: false
+})
+RETURN m{.*} AS migration
+"""
+
+_Q_GET_MIGRATIONS = """
+MATCH (m:Migration {project: $project})
+RETURN m{.*} AS migration
+ORDER BY m.seq
+SKIP $offset
+LIMIT $limit
+"""
+
+_Q_GET_PENDING_MIGRATION = """
+MATCH (m:Migration {project: $project, seq: $seq, applied: false})
+RETURN m{.*} AS migration
+"""
+
+_Q_MARK_MIGRATION_APPLIED = """
+MATCH (m:Migration {project: $project, seq: $seq})
+SET m.applied = true, m.applied_at = datetime()
+"""
+
+
+# Upper bound on the page size of any paginated read.
+_MAX_PAGE_SIZE = 200
+
+
+def _page(limit: int, offset: int = 0) -> tuple[int, int]:
+    """Clamp caller-supplied paging to ``1.._MAX_PAGE_SIZE`` and ``offset >= 0``."""
+    return max(1, min(limit, _MAX_PAGE_SIZE)), max(0, offset)
+
+# Records requested per PULL round trip on explicit sessions (the driver
+# default, made explicit); also the batch size of streamed run_cypher rows.
+_FETCH_SIZE = 1000
+
+# Backs every {name, project} lookup and gives MERGE a lock on exactly
+# that key; supersedes the old single-property name index once it exists.
+_DDL_ENTITY_KEY = (
+    "CREATE CONSTRAINT entity_project_name_unique IF NOT EXISTS "
+    "FOR (e:Entity) REQUIRE (e.project, e.name) IS UNIQUE"
+)
+_DDL_ENTITY_NAME = "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)"
+_DDL_DROP_ENTITY_NAME = "DROP INDEX entity_name IF EXISTS"
+
+# Raised by CREATE CONSTRAINT when existing data violates it.
+_CONSTRAINT_CREATION_FAILED = "Neo.DatabaseError.Schema.ConstraintCreationFailed"
+
+# Independent schema statements run concurrently by _ensure_indexes().
+_INDEX_DDL = (
+    "CREATE INDEX entity_project IF NOT EXISTS FOR (e:Entity) ON (e.project)",
+    "CREATE INDEX migration_project IF NOT EXISTS FOR (m:Migration) ON (m.project)",
+    "CREATE FULLTEXT INDEX entity_fulltext IF NOT EXISTS "
+    "FOR (e:Entity) ON EACH [e.name, e.observations]",
+)
+
+# How long cached reads (list_projects, get_entity, get_project_graph) may
+# be served, in seconds. Bounds staleness from writers outside this process.
+_CACHE_TTL = 30.0
+
+# Maximum number of cached get_entity / get_project_graph results.
+_CACHE_SIZE = 256
+
+# Raised when schema and data writes are mixed in one transaction.
+_SCHEMA_TX_CONFLICT = "Neo.ClientError.Transaction.ForbiddenDueToTransactionType"
+
+
+async def _load_pending(tx: AsyncManagedTransaction, project: str, seq: int) -> dict | None:
+    result = await tx.run(_Q_GET_PENDING_MIGRATION, project=project, seq=seq)
+    record = await result.single()
+    return record["migration"] if record else None
+
+
+async def _apply_and_mark(
+    tx: AsyncManagedTransaction, cypher_up: str, project: str, seq: int
+) -> None:
+    result = await tx.run(cypher_up)
+    await result.consume()
+    await tx.run(_Q_MARK_MIGRATION_APPLIED, project=project, seq=seq)
+
+
+async def _bulk_merge(tx: AsyncManagedTransaction, rows: list[dict[str, Any]]) -> list[dict]:
+    result = await tx.run(_Q_CREATE_ENTITIES, rows=rows)
+    return await result.value("entity")
+
+
+class _WriteCoalescer:
+    """Coalesce concurrent row submissions into shared write transactions.
+
+    Submissions arriving within ``flush_interval`` seconds of the first
+    one are flushed together, up to ``max_batch`` rows; a submission that
+    would overflow the batch starts the next one instead. Only a single
+    submission larger than ``max_batch`` is flushed over the limit.
+    Each submitter gets back the slice of results for its own rows.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[dict[str, Any]]], Awaitable[list[dict]]],
+        flush_interval: float = 0.02,
+        max_batch: int = 500,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._flush = flush
+        self._queue: asyncio.Queue[tuple[list[dict[str, Any]], asyncio.Future]] | None = None
+        self._task: asyncio.Task | None = None
+
+    async def submit(self, rows: list[dict[str, Any]]) -> list[dict]:
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((rows, future))
+        return await future
+
+    async def close(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        while not self._queue.empty():
+            self._queue.get_nowait()[1].cancel()
+        self._task = None
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        # A submission that did not fit the previous batch; it opens the next.
+        held = None
+        while True:
+            batch = [held or await self._queue.get()]
+            held = None
+            try:
+                size = len(batch[0][0])
+                deadline = loop.time() + self.flush_interval
+                while size < self.max_batch:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        item = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    if size + len(item[0]) > self.max_batch:
+                        held = item
+                        break
+                    batch.append(item)
+                    size += len(item[0])
+                results = await self._flush([row for rows, _ in batch for row in rows])
+            except asyncio.CancelledError:
+                for _, future in batch:
+                    future.cancel()
+                if held:
+                    held[1].cancel()
+                raise
+            except Exception as exc:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            offset = 0
+            for rows, future in batch:
+                if not future.done():
+                    future.set_result(results[offset : offset + len(rows)])
+                offset += len(rows)
+
+
+def _entity_rows(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Map ``create_entity``-style items onto ``_Q_CREATE_ENTITIES`` rows."""
+    return [
+        {
+            "name": item["name"],
+            "type": item["entity_type"],
+            "project": item["project"],
+            "observations": item.get("observations") or [],
+            "properties": item.get("properties") or {},
+        }
+        for item in items
+    ]
 
 
 @dataclass
@@ -17,33 +399,141 @@ class KnowledgeGraph:
     password: str
     database: str = "neo4j"
     _driver: AsyncDriver | None = field(default=None, repr=False)
+    _projects: tuple[float, list[str]] | None = field(default=None, repr=False)
+    _projects_lock: asyncio.Lock = field(default_factory=asyncio.Lock, repr=False)
+    _projects_generation: int = field(default=0, repr=False)
+    _entity_batcher: _WriteCoalescer | None = field(default=None, repr=False)
+    _cache: OrderedDict[tuple, tuple[float, Any]] = field(default_factory=OrderedDict, repr=False)
+    _cache_versions: defaultdict[str, int] = field(
+        default_factory=lambda: defaultdict(int), repr=False
+    )
 
     async def connect(self) -> None:
         self._driver = AsyncGraphDatabase.driver(
             self.uri,
             auth=(self.username, self.password),
             notifications_disabled_categories=[NotificationDisabledCategory.SCHEMA],
+            max_connection_pool_size=64,
+            connection_acquisition_timeout=15,
+            connection_timeout=5,
+            keep_alive=True,
+            # Ping connections idle for longer than this before reuse, so a
+            # connection dropped by a proxy or the server is not handed out.
+            liveness_check_timeout=30,
         )
+        # Fail fast on an unreachable server or bad credentials; the schema
+        # DDL below would otherwise retry until max_transaction_retry_time.
         await self._driver.verify_connectivity()
         await self._ensure_indexes()
+        self._entity_batcher = _WriteCoalescer(self._merge_entities)
 
     async def close(self) -> None:
+        if self._entity_batcher:
+            await self._entity_batcher.close()
         if self._driver:
             await self._driver.close()
 
+    def _session(self, **config: Any) -> AsyncSession:
+        """Open a session on the configured database."""
+        return self._driver.session(database=self.database, fetch_size=_FETCH_SIZE, **config)
+
+    async def _read(self, query: str, /, **params: Any) -> list[Record]:
+        """Run a read query on a pooled session and return its records."""
+        result = await self._driver.execute_query(
+            query, params, database_=self.database, routing_=RoutingControl.READ
+        )
+        return result.records
+
+    async def _write(self, query: str, /, **params: Any) -> list[Record]:
+        """Run a write query on a pooled session and return its records."""
+        result = await self._driver.execute_query(
+            query, params, database_=self.database, routing_=RoutingControl.WRITE
+        )
+        return result.records
+
+    async def _merge_entities(self, rows: list[dict[str, Any]]) -> list[dict]:
+        """Merge entity rows in one managed (retried) write transaction.
+
+        The rows' projects are invalidated however the write ends. Bulk
+        chunks commit independently of the call that queued them, so a
+        failure or cancellation elsewhere must not leave stale reads behind.
+        """
+        try:
+            async with self._session() as session:
+                return await session.execute_write(_bulk_merge, rows)
+        finally:
+            for project in {row["project"] for row in rows}:
+                self._invalidate(project)
+
+    def _drop_projects(self) -> None:
+        """Drop the cached project list and any list still being loaded."""
+        self._projects_generation += 1
+        self._projects = None
+
+    def _note_project(self, project: str) -> None:
+        """Drop the cached project list if ``project`` may not be part of it."""
+        # With no list cached, a load may be in flight that misses ``project``.
+        if self._projects is None or project not in self._projects[1]:
+            self._drop_projects()
+
+    def _invalidate(self, project: str) -> None:
+        """Record a write to ``project``, invalidating its cached reads."""
+        self._cache_versions[project] += 1
+        self._note_project(project)
+
+    async def _cached(
+        self, project: str, key: tuple, load: Callable[..., Awaitable[Any]], *args: Any
+    ) -> Any:
+        """Serve ``load(*args)`` from the LRU cache, keyed by project version."""
+        # The version is read before loading, so a write that lands while
+        # the query runs files the result under an already stale key.
+        full_key = (project, self._cache_versions[project], *key)
+        now = time.monotonic()
+        hit = self._cache.get(full_key)
+        if hit and now - hit[0] < _CACHE_TTL:
+            self._cache.move_to_end(full_key)
+            return hit[1]
+        value = await load(*args)
+        self._cache[full_key] = (now, value)
+        self._cache.move_to_end(full_key)
+        while len(self._cache) > _CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return value
+
+    async def _gather_reads(
+        self, *queries: tuple[str, dict[str, Any]]
+    ) -> list[list[Record]]:
+        """Run independent read queries concurrently, one pooled session each."""
+        return await asyncio.gather(*(self._read(query, **params) for query, params in queries))
+
     async def _ensure_indexes(self) -> None:
         """Create indexes for efficient lookups."""
-        async with self._driver.session(database=self.database) as session:
-            await session.run(
-                "CREATE INDEX entity_name IF NOT EXISTS FOR (e:Entity) ON (e.name)"
-            )
-            await session.run(
-                "CREATE INDEX entity_project IF NOT EXISTS FOR (e:Entity) ON (e.project)"
-            )
-            await session.run(
-                "CREATE INDEX migration_project IF NOT EXISTS "
-                "FOR (m:Migration) ON (m.project)"
+        await asyncio.gather(
+            self._ensure_entity_key(),
+            *(self._driver.execute_query(ddl, database_=self.database) for ddl in _INDEX_DDL),
+        )
+
+    async def _ensure_entity_key(self) -> None:
+        """Create the (project, name) uniqueness constraint.
+
+        Graphs written before the constraint existed may hold duplicate
+        entities, which makes its creation fail. The server then keeps
+        the single-property name index and starts anyway.
+        """
+        try:
+            await self._driver.execute_query(_DDL_ENTITY_KEY, database_=self.database)
+        except Neo4jError as exc:
+            if exc.code != _CONSTRAINT_CREATION_FAILED:
+                raise
+            logger.warning(
+                "Could not create constraint entity_project_name_unique: the graph "
+                "holds duplicate (project, name) entities. Merge them (see the "
+                "README, 'Duplicate entities') and restart to enable it. %s",
+                exc.message,
             )
+            await self._driver.execute_query(_DDL_ENTITY_NAME, database_=self.database)
+            return
+        await self._driver.execute_query(_DDL_DROP_ENTITY_NAME, database_=self.database)
 
     # ── Entities ──────────────────────────────────────────────────────
 
@@ -58,60 +548,58 @@ class KnowledgeGraph:
         """Create or merge an entity node in the knowledge graph."""
         props = properties or {}
         obs = observations or []
-        query = """
-        MERGE (e:Entity {name: $name, project: $project})
-        ON CREATE SET
-            e.type = $entity_type,
-            e.observations = $observations,
-            e.created_at = datetime(),
-            e.updated_at = datetime()
-        ON MATCH SET
-            e.type = $entity_type,
-            e.observations = e.observations + $observations,
-            e.updated_at = datetime()
-        SET e += $properties
-        RETURN e{.*, labels: labels(e)} AS entity
+        records = await self._write(
+            _Q_CREATE_ENTITY,
+            name=name,
+            project=project,
+            entity_type=entity_type,
+            observations=obs,
+            properties=props,
+        )
+        self._invalidate(project)
+        return records[0]["entity"] if records else {}
+
+    async def create_entities(self, items: list[dict[str, Any]]) -> list[dict]:
+        """Create or merge many entities in a single UNWIND transaction.
+
+        Each item takes the same keys as ``create_entity``'s arguments.
         """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(
-                query,
-                name=name,
-                project=project,
-                entity_type=entity_type,
-                observations=obs,
-                properties=props,
-            )
-            record = await result.single()
-            return record["entity"] if record else {}
+        return await self._merge_entities(_entity_rows(items))
+
+    async def create_entities_bulk(self, items: list[dict[str, Any]]) -> list[dict]:
+        """Create or merge a large number of entities.
+
+        Rows are written in chunks of at most ``max_batch`` rows and
+        coalesced with concurrent bulk calls, so the whole call is not
+        atomic: each chunk commits on its own. A chunk shares its
+        transaction with other callers' rows, so one caller's invalid row
+        fails the whole shared transaction for everyone in it.
+        """
+        rows = _entity_rows(items)
+        batcher = self._entity_batcher
+        chunks = [
+            rows[i : i + batcher.max_batch] for i in range(0, len(rows), batcher.max_batch)
+        ]
+        results = await asyncio.gather(*(batcher.submit(chunk) for chunk in chunks))
+        return [entity for chunk in results for entity in chunk]
 
     async def add_observations(
         self, name: str, project: str, observations: list[str]
     ) -> dict:
         """Append observations to an existing entity."""
-        query = """
-        MATCH (e:Entity {name: $name, project: $project})
-        SET e.observations = e.observations + $observations,
-            e.updated_at = datetime()
-        RETURN e{.*, labels: labels(e)} AS entity
-        """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(
-                query, name=name, project=project, observations=observations
-            )
-            record = await result.single()
-            return record["entity"] if record else {}
+        records = await self._write(
+            _Q_ADD_OBS, name=name, project=project, observations=observations
+        )
+        self._invalidate(project)
+        return records[0]["entity"] if records else {}
 
     async def delete_entity(self, name: str, project: str) -> bool:
         """Delete an entity and all its relationships."""
-        query = """
-        MATCH (e:Entity {name: $name, project: $project})
-        DETACH DELETE e
-        RETURN count(e) AS deleted
-        """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query, name=name, project=project)
-            record = await result.single()
-            return record["deleted"] > 0
+        records = await self._write(_Q_DELETE_ENTITY, name=name, project=project)
+        self._invalidate(project)
+        # The project may have just lost its last entity.
+        self._drop_projects()
+        return records[0]["deleted"] > 0
 
     # ── Relationships ─────────────────────────────────────────────────
 
@@ -125,125 +613,153 @@ class KnowledgeGraph:
     ) -> dict:
         """Create a typed relationship between two entities."""
         props = properties or {}
-        # Cypher doesn't support parameterised relationship types,
-        # so we sanitise and interpolate the type name.
-        safe_type = "".join(c if c.isalnum() or c == "_" else "_" for c in relation_type.upper())
-        query = f"""
-        MATCH (a:Entity {{name: $from_name, project: $project}})
-        MATCH (b:Entity {{name: $to_name, project: $project}})
-        MERGE (a)-[r:{safe_type}]->(b)
-        SET r += $properties, r.created_at = coalesce(r.created_at, datetime())
-        RETURN type(r) AS type,
-               a.name AS from, b.name AS to,
-               properties(r) AS properties
+        records = await self._write(
+            _Q_CREATE_RELATIONSHIP,
+            from_name=from_entity,
+            to_name=to_entity,
+            rel_type=_safe_rel_type(relation_type),
+            project=project,
+            properties=props,
+        )
+        self._invalidate(project)
+        return dict(records[0]) if records else {}
+
+    async def create_relationships(self, items: list[dict[str, Any]]) -> list[dict]:
+        """Create many relationships in a single UNWIND round trip.
+
+        Each item takes the same keys as ``create_relationship``'s arguments.
         """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(
-                query,
-                from_name=from_entity,
-                to_name=to_entity,
-                project=project,
-                properties=props,
-            )
-            record = await result.single()
-            if not record:
-                return {}
-            return dict(record)
+        rows = [
+            {
+                "from_name": item["from_entity"],
+                "to_name": item["to_entity"],
+                "rel_type": _safe_rel_type(item["relation_type"]),
+                "project": item["project"],
+                "properties": item.get("properties") or {},
+            }
+            for item in items
+        ]
+        records = await self._write(_Q_CREATE_RELATIONSHIPS, rows=rows)
+        for project in {row["project"] for row in rows}:
+            self._invalidate(project)
+        return [dict(record) for record in records]
 
     async def delete_relationship(
         self, from_entity: str, to_entity: str, relation_type: str, project: str
     ) -> bool:
         """Delete a specific relationship between two entities."""
-        safe_type = "".join(c if c.isalnum() or c == "_" else "_" for c in relation_type.upper())
-        query = f"""
-        MATCH (a:Entity {{name: $from_name, project: $project}})
-              -[r:{safe_type}]->
-              (b:Entity {{name: $to_name, project: $project}})
-        DELETE r
-        RETURN count(r) AS deleted
-        """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(
-                query, from_name=from_entity, to_name=to_entity, project=project
-            )
-            record = await result.single()
-            return record["deleted"] > 0
+        records = await self._write(
+            _Q_DELETE_RELATIONSHIP,
+            from_name=from_entity,
+            to_name=to_entity,
+            rel_type=_safe_rel_type(relation_type),
+            project=project,
+        )
+        self._invalidate(project)
+        return records[0]["deleted"] > 0
 
     # ── Queries ───────────────────────────────────────────────────────
 
     async def get_entity(self, name: str, project: str) -> dict:
-        """Get an entity with all its relationships (context for LLM)."""
-        query = """
-        MATCH (e:Entity {name: $name, project: $project})
-        OPTIONAL MATCH (e)-[r]->(target:Entity)
-        OPTIONAL MATCH (source:Entity)-[ri]->(e)
-        WITH e,
-             collect(DISTINCT {type: type(r), target: target.name, target_type: target.type}) AS outgoing,
-             collect(DISTINCT {type: type(ri), source: source.name, source_type: source.type}) AS incoming
-        RETURN e{.*, labels: labels(e)} AS entity,
-               [x IN outgoing WHERE x.target IS NOT NULL] AS outgoing_relations,
-               [x IN incoming WHERE x.source IS NOT NULL] AS incoming_relations
-        """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query, name=name, project=project)
-            record = await result.single()
-            if not record:
-                return {}
-            return {
-                "entity": record["entity"],
-                "outgoing_relations": record["outgoing_relations"],
-                "incoming_relations": record["incoming_relations"],
-            }
+        """Get an entity with all its relationships (context for LLM).
 
-    async def search(self, query_text: str, project: str | None = None) -> list[dict]:
-        """Search entities by name or observations (case-insensitive contains)."""
-        project_filter = "AND e.project = $project" if project else ""
-        query = f"""
-        MATCH (e:Entity)
-        WHERE (e.name CONTAINS $query OR
-               any(obs IN e.observations WHERE obs CONTAINS $query))
-              {project_filter}
-        RETURN e{{.*, labels: labels(e)}} AS entity
-        ORDER BY e.updated_at DESC
-        LIMIT 25
+        Results are cached until the next write to ``project``.
         """
-        params: dict[str, Any] = {"query": query_text}
-        if project:
-            params["project"] = project
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query, **params)
-            return [record["entity"] async for record in result]
-
-    async def get_project_graph(self, project: str) -> dict:
-        """Get the full knowledge graph for a project."""
-        query = """
-        MATCH (e:Entity {project: $project})
-        OPTIONAL MATCH (e)-[r]->(t:Entity {project: $project})
-        RETURN collect(DISTINCT e{.name, .type, .observations}) AS entities,
-               collect(DISTINCT {
-                   from: e.name, to: t.name, type: type(r)
-               }) AS relationships
+        return await self._cached(project, ("entity", name), self._fetch_entity, name, project)
+
+    async def _fetch_entity(self, name: str, project: str) -> dict:
+        records = await self._read(_Q_GET_ENTITY, name=name, project=project)
+        if not records:
+            return {}
+        record = records[0]
+        return {
+            "entity": record["entity"],
+            "outgoing_relations": record["outgoing_relations"],
+            "incoming_relations": record["incoming_relations"],
+        }
+
+    async def search(
+        self,
+        query_text: str,
+        project: str | None = None,
+        limit: int = 25,
+        offset: int = 0,
+    ) -> list[dict]:
+        """Search entities by name or observations via the full-text index."""
+        # Lucene cannot parse an empty query.
+        if not query_text.strip():
+            return []
+        limit, offset = _page(limit, offset)
+        records = await self._read(
+            _Q_SEARCH,
+            query=_escape_lucene(query_text),
+            project=project,
+            limit=limit,
+            offset=offset,
+        )
+        return [record["entity"] for record in records]
+
+    async def get_project_graph(
+        self, project: str, after_name: str | None = None, limit: int = _MAX_PAGE_SIZE
+    ) -> dict:
+        """Get one page of the knowledge graph for a project.
+
+        Pages are ordered by entity name; pass the returned ``next_after``
+        as ``after_name`` to fetch the next one. It is ``None`` on the last page.
+        Results are cached until the next write to ``project``.
         """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query, project=project)
-            record = await result.single()
-            rels = [r for r in record["relationships"] if r["to"] is not None]
-            return {
-                "project": project,
-                "entities": record["entities"],
-                "relationships": rels,
-            }
+        limit, _ = _page(limit)
+        return await self._cached(
+            project,
+            ("graph", after_name, limit),
+            self._fetch_project_graph,
+            project,
+            after_name,
+            limit,
+        )
+
+    async def _fetch_project_graph(
+        self, project: str, after_name: str | None, limit: int
+    ) -> dict:
+        params = {
+            "project": project,
+            "after_name": after_name,
+            "limit": limit,
+        }
+        if after_name is None:
+            queries = (_Q_PROJECT_ENTITIES, _Q_PROJECT_RELATIONSHIPS)
+        else:
+            queries = (_Q_PROJECT_ENTITIES_AFTER, _Q_PROJECT_RELATIONSHIPS_AFTER)
+        entity_records, rel_records = await self._gather_reads(
+            *((query, params) for query in queries)
+        )
+        entities = [record["entity"] for record in entity_records]
+        return {
+            "project": project,
+            "entities": entities,
+            "relationships": [record["relationship"] for record in rel_records],
+            "next_after": (
+                entities[-1]["name"] if entities and len(entities) == limit else None
+            ),
+        }
 
     async def list_projects(self) -> list[str]:
-        """List all projects in the knowledge graph."""
-        query = """
-        MATCH (e:Entity)
-        RETURN DISTINCT e.project AS project
-        ORDER BY project
+        """List all projects in the knowledge graph.
+
+        The answer is cached for ``_CACHE_TTL`` seconds and invalidated
+        when an entity is created in an unknown project or deleted.
         """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query)
-            return [record["project"] async for record in result]
+        async with self._projects_lock:
+            if self._projects and time.monotonic() - self._projects[0] < _CACHE_TTL:
+                return list(self._projects[1])
+            # As with _cached: a write that lands during the read bumps the
+            # generation, and the stale list it returned is not stored.
+            generation = self._projects_generation
+            records = await self._read(_Q_LIST_PROJECTS)
+            projects = [record["project"] for record in records]
+            if generation == self._projects_generation:
+                self._projects = (time.monotonic(), projects)
+            return list(projects)
 
     # ── Migrations ────────────────────────────────────────────────────
 
@@ -256,74 +772,66 @@ class KnowledgeGraph:
         version: str | None = None,
     ) -> dict:
         """Record a schema/data migration for a project."""
-        query = """
-        MATCH (latest:Migration {project: $project})
-        WITH max(latest.seq) AS max_seq
-        WITH coalesce(max_seq, 0) + 1 AS next_seq
-        CREATE (m:Migration {
-            project: $project,
-            seq: next_seq,
-            version: coalesce($version, toString(next_seq)),
-            description: $description,
-            cypher_up: $cypher_up,
-            cypher_down: $cypher_down,
-            created_at: datetime(),
-            applied: false
-        })
-        RETURN m{.*} AS migration
-        """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(
-                query,
-                project=project,
-                description=description,
-                cypher_up=cypher_up,
-                cypher_down=cypher_down,
-                version=version,
-            )
-            record = await result.single()
-            return record["migration"] if record else {}
-
-    async def get_migrations(self, project: str) -> list[dict]:
-        """Get migration history for a project."""
-        query = """
-        MATCH (m:Migration {project: $project})
-        RETURN m{.*} AS migration
-        ORDER BY m.seq
-        """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query, project=project)
-            return [record["migration"] async for record in result]
+        records = await self._write(
+            _Q_ADD_MIGRATION,
+            project=project,
+            description=description,
+            cypher_up=cypher_up,
+            cypher_down=cypher_down,
+            version=version,
+        )
+        return records[0]["migration"] if records else {}
+
+    async def get_migrations(
+        self, project: str, limit: int = 100, offset: int = 0
+    ) -> list[dict]:
+        """Get migration history for a project, oldest first."""
+        limit, offset = _page(limit, offset)
+        records = await self._read(
+            _Q_GET_MIGRATIONS,
+            project=project,
+            limit=limit,
+            offset=offset,
+        )
+        return [record["migration"] for record in records]
 
     async def apply_migration(self, project: str, seq: int) -> dict:
-        """Execute a migration's cypher_up and mark it as applied."""
-        get_query = """
-        MATCH (m:Migration {project: $project, seq: $seq, applied: false})
-        RETURN m{.*} AS migration
+        """Execute a migration's cypher_up and mark it as applied.
+
+        Both statements share one transaction, so a migration is only
+        marked applied if it actually committed.
         """
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(get_query, project=project, seq=seq)
-            record = await result.single()
-            if not record:
+        async with self._session() as session:
+            migration = await session.execute_read(_load_pending, project, seq)
+            if not migration:
                 return {"error": "Migration not found or already applied"}
 
-            migration = record["migration"]
-            # Execute the migration
-            await session.run(migration["cypher_up"])
-            # Mark as applied
-            await session.run(
-                "MATCH (m:Migration {project: $project, seq: $seq}) "
-                "SET m.applied = true, m.applied_at = datetime()",
-                project=project,
-                seq=seq,
-            )
-            migration["applied"] = True
-            return migration
+            try:
+                await session.execute_write(
+                    _apply_and_mark, migration["cypher_up"], project, seq
+                )
+            except ClientError as exc:
+                if exc.code != _SCHEMA_TX_CONFLICT:
+                    raise
+                # Schema migrations (indexes, constraints) cannot share a
+                # transaction with the data write that marks them applied.
+                await session.run(migration["cypher_up"])
+                await session.run(_Q_MARK_MIGRATION_APPLIED, project=project, seq=seq)
+        # Migrations run arbitrary Cypher, which may touch any project.
+        for cached_project in self._cache_versions:
+            self._cache_versions[cached_project] += 1
+        self._cache.clear()
+        self._drop_projects()
+        migration["applied"] = True
+        return migration
 
     # ── Raw Cypher ────────────────────────────────────────────────────
 
-    async def run_cypher(self, query: str, params: dict[str, Any] | None = None) -> list[dict]:
-        """Execute an arbitrary read-only Cypher query."""
-        async with self._driver.session(database=self.database) as session:
-            result = await session.run(query, **(params or {}))
-            return [dict(record) async for record in result]
+    async def run_cypher(
+        self, query: str, params: dict[str, Any] | None = None
+    ) -> AsyncIterator[list[dict]]:
+        """Execute an arbitrary read-only Cypher query, yielding batches of rows."""
+        async with self._session(default_access_mode=READ_ACCESS) as session:
+            result = await session.run(query, params or {})
+            while records := await result.fetch(_FETCH_SIZE):
+                yield [dict(record) for record in records]
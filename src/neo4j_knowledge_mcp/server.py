@@ -3,12 +3,13 @@
 from __future__ import annotations
 
 import argparse
-import json
 import os
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import Any
 
+import orjson
 from mcp.server.fastmcp import FastMCP
 
 from neo4j_knowledge_mcp.graph import KnowledgeGraph
@@ -42,13 +43,51 @@ mcp = FastMCP(
 )
 
 
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC
+
+
+def _default(o: Any) -> Any:
+    # orjson handles stdlib datetimes natively; this only fires for driver
+    # temporal types (neo4j.time.*) and other unknown objects.
+    if hasattr(o, "isoformat"):
+        return o.isoformat()
+    return str(o)
+
+
 def _json(obj: Any) -> str:
     """Serialise arbitrary Neo4j results to JSON."""
-    def default(o: Any) -> Any:
-        if hasattr(o, "isoformat"):
-            return o.isoformat()
-        return str(o)
-    return json.dumps(obj, indent=2, default=default, ensure_ascii=False)
+    return orjson.dumps(
+        obj, default=_default, option=_JSON_OPTIONS | orjson.OPT_INDENT_2
+    ).decode()
+
+
+# Serialised output of cacheable reads, keyed by tool call. An entry is
+# reused only while the graph layer still returns the very same (cached)
+# result object, so it follows the graph cache's invalidation.
+_JSON_CACHE_SIZE = 256
+_json_cache: OrderedDict[tuple, tuple[Any, str]] = OrderedDict()
+
+
+def _json_cached(key: tuple, obj: Any) -> str:
+    """Like ``_json``, but reuse the JSON of an identical earlier result."""
+    hit = _json_cache.get(key)
+    if hit and hit[0] is obj:
+        _json_cache.move_to_end(key)
+        return hit[1]
+    text = _json(obj)
+    _json_cache[key] = (obj, text)
+    _json_cache.move_to_end(key)
+    while len(_json_cache) > _JSON_CACHE_SIZE:
+        _json_cache.popitem(last=False)
+    return text
+
+
+async def _json_stream(batches: AsyncIterator[list[Any]]) -> str:
+    """Serialise row batches into one JSON array as they arrive, keeping only their bytes."""
+    parts: list[bytes] = []
+    async for batch in batches:
+        parts.extend(orjson.dumps(row, default=_default, option=_JSON_OPTIONS) for row in batch)
+    return (b"[" + b",".join(parts) + b"]").decode()
 
 
 # ── Tools: Entities ───────────────────────────────────────────────────
@@ -74,6 +113,40 @@ async def create_entity(
     return _json(result)
 
 
+@mcp.tool()
+async def create_entities(items: list[dict[str, Any]]) -> str:
+    """Create or update many knowledge entities in one call.
+
+    Prefer this over repeated `create_entity` calls when ingesting
+    several entities at once.
+
+    Args:
+        items: Entities to create. Each item has the keys `name`,
+            `entity_type`, `project` and optionally `observations`
+            and `properties`, as in `create_entity`.
+    """
+    results = await kg.create_entities(items)
+    return _json(results)
+
+
+@mcp.tool()
+async def create_entities_bulk(items: list[dict[str, Any]]) -> str:
+    """Ingest a large batch of knowledge entities.
+
+    Like `create_entities`, but written in chunks of up to 500 rows that
+    are shared with other concurrent bulk calls. Faster for big imports;
+    each chunk commits independently, so the call as a whole is not atomic.
+    Because a chunk can hold rows from other concurrent calls, an invalid
+    row from any of them fails the whole chunk, including your rows in it;
+    retry the failed call.
+
+    Args:
+        items: Entities to create, with the same keys as in `create_entities`.
+    """
+    results = await kg.create_entities_bulk(items)
+    return _json(results)
+
+
 @mcp.tool()
 async def add_observations(name: str, project: str, observations: list[str]) -> str:
     """Append new observations to an existing entity.
@@ -124,6 +197,19 @@ async def create_relationship(
     return _json(result)
 
 
+@mcp.tool()
+async def create_relationships(items: list[dict[str, Any]]) -> str:
+    """Create many typed relationships in one call.
+
+    Args:
+        items: Relationships to create. Each item has the keys
+            `from_entity`, `to_entity`, `relation_type`, `project` and
+            optionally `properties`, as in `create_relationship`.
+    """
+    results = await kg.create_relationships(items)
+    return _json(results)
+
+
 @mcp.tool()
 async def delete_relationship(
     from_entity: str, to_entity: str, relation_type: str, project: str
@@ -154,33 +240,43 @@ async def get_entity(name: str, project: str) -> str:
         project: Project scope.
     """
     result = await kg.get_entity(name, project)
-    return _json(result)
+    return _json_cached(("get_entity", name, project), result)
 
 
 @mcp.tool()
-async def search_knowledge(query: str, project: str | None = None) -> str:
+async def search_knowledge(
+    query: str, project: str | None = None, limit: int = 25, offset: int = 0
+) -> str:
     """Search the knowledge graph by text (entity names and observations).
 
     Args:
-        query: Text to search for (case-insensitive contains).
+        query: Text to search for (full-text match, best hits first).
         project: Optional project filter.
+        limit: Maximum number of results (capped at 200).
+        offset: Number of results to skip, for paging.
     """
-    results = await kg.search(query, project)
+    results = await kg.search(query, project, limit, offset)
     return _json(results)
 
 
 @mcp.tool()
-async def get_project_graph(project: str) -> str:
-    """Get the complete knowledge graph for a project.
+async def get_project_graph(
+    project: str, after_name: str | None = None, limit: int = 200
+) -> str:
+    """Get the knowledge graph for a project, one page at a time.
 
-    Returns all entities and relationships — useful as full project
-    context for an LLM session.
+    Returns entities (ordered by name) and their outgoing relationships —
+    useful as full project context for an LLM session. If `next_after`
+    in the result is set, call again with it as `after_name` for the
+    next page.
 
     Args:
         project: Project name.
+        after_name: Resume after this entity name (from `next_after`).
+        limit: Maximum number of entities per page (capped at 200).
     """
-    result = await kg.get_project_graph(project)
-    return _json(result)
+    result = await kg.get_project_graph(project, after_name, limit)
+    return _json_cached(("get_project_graph", project, after_name, limit), result)
 
 
 @mcp.tool()
@@ -217,13 +313,15 @@ async def add_migration(
 
 
 @mcp.tool()
-async def get_migrations(project: str) -> str:
-    """Get the full migration history for a project.
+async def get_migrations(project: str, limit: int = 100, offset: int = 0) -> str:
+    """Get the migration history for a project, oldest first.
 
     Args:
         project: Project name.
+        limit: Maximum number of migrations (capped at 200).
+        offset: Number of migrations to skip, for paging.
     """
-    results = await kg.get_migrations(project)
+    results = await kg.get_migrations(project, limit, offset)
     return _json(results)
 
 
@@ -251,8 +349,7 @@ async def run_cypher(query: str, params: dict[str, Any] | None = None) -> str:
         query: Cypher query string.
         params: Optional query parameters.
     """
-    results = await kg.run_cypher(query, params)
-    return _json(results)
+    return await _json_stream(kg.run_cypher(query, params))
 
 
 # ── Entrypoint ────────────────────────────────────────────────────────
@@ -0,0 +1,327 @@
+"""Tests for KnowledgeGraph helpers that don't need a running Neo4j."""
+
+import asyncio
+
+import pytest
+
+from neo4j_knowledge_mcp import graph as graph_module
+from neo4j_knowledge_mcp.graph import (
+    KnowledgeGraph,
+    _WriteCoalescer,
+    _escape_lucene,
+    _safe_rel_type,
+)
+
+
+def _graph() -> KnowledgeGraph:
+    return KnowledgeGraph(uri="bolt://localhost:7687", username="neo4j", password="password")
+
+
+# ── Full-text search ──────────────────────────────────────────────────
+
+def test_escape_lucene_escapes_special_characters():
+    assert _escape_lucene('a+b (c) "d"') == r'a\+b \(c\) \"d\"'
+
+
+def test_escape_lucene_neutralises_operator_keywords():
+    assert _escape_lucene("cats AND dogs OR NOT birds") == "cats and dogs or not birds"
+    assert _escape_lucene("ANDROID") == "ANDROID"
+
+
+def test_search_blank_query_returns_nothing_without_querying():
+    # No driver is connected, so reaching the database would raise.
+    assert asyncio.run(_graph().search("   ")) == []
+
+
+# ── Relationship types ────────────────────────────────────────────────
+
+def test_safe_rel_type_keeps_non_latin_letters():
+    assert _safe_rel_type("depends on") == "DEPENDS_ON"
+    assert _safe_rel_type("зависит") == "ЗАВИСИТ"
+    assert _safe_rel_type("dépend-de") == "DÉPEND_DE"
+
+
+# ── Paging ────────────────────────────────────────────────────────────
+
+def _recording_graph(calls: list[dict]) -> KnowledgeGraph:
+    async def read(query, /, **params):
+        calls.append(params)
+        return []
+
+    graph = _graph()
+    graph._read = read
+    return graph
+
+
+def test_paging_inputs_are_clamped_before_reaching_cypher():
+    calls: list[dict] = []
+    graph = _recording_graph(calls)
+    asyncio.run(graph.search("cats", limit=-5, offset=-3))
+    asyncio.run(graph.get_migrations("demo", limit=10_000, offset=-1))
+    assert [(c["limit"], c["offset"]) for c in calls] == [(1, 0), (200, 0)]
+
+
+def test_project_graph_with_zero_limit_returns_an_empty_last_page():
+    calls: list[dict] = []
+    page = asyncio.run(_recording_graph(calls).get_project_graph("demo", limit=0))
+    assert page["entities"] == [] and page["next_after"] is None
+    assert {c["limit"] for c in calls} == {1}
+
+
+# ── Read cache ────────────────────────────────────────────────────────
+
+class _CountingLoad:
+    """A cache loader that counts calls and can be held mid-load."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        await self.release.wait()
+        return {"load": self.calls}
+
+
+def _cache_twice(graph: KnowledgeGraph, load: _CountingLoad, between=lambda: None) -> tuple:
+    async def scenario():
+        first = await graph._cached("demo", ("k",), load)
+        between()
+        second = await graph._cached("demo", ("k",), load)
+        return first, second
+
+    return asyncio.run(scenario())
+
+
+def test_cached_read_is_served_until_the_project_is_written():
+    load = _CountingLoad()
+    first, second = _cache_twice(_graph(), load)
+    assert first is second and load.calls == 1
+
+
+def test_cached_read_is_reloaded_after_a_write_to_its_project():
+    graph, load = _graph(), _CountingLoad()
+    first, second = _cache_twice(graph, load, lambda: graph._invalidate("demo"))
+    assert first is not second and load.calls == 2
+
+
+def test_cached_read_survives_a_write_to_another_project():
+    graph, load = _graph(), _CountingLoad()
+    first, second = _cache_twice(graph, load, lambda: graph._invalidate("other"))
+    assert first is second and load.calls == 1
+
+
+def test_cached_read_expires_after_the_ttl(monkeypatch):
+    monkeypatch.setattr(graph_module, "_CACHE_TTL", 0.0)
+    load = _CountingLoad()
+    first, second = _cache_twice(_graph(), load)
+    assert first is not second and load.calls == 2
+
+
+def test_write_during_a_load_keeps_its_result_out_of_the_cache():
+    async def scenario():
+        graph, load = _graph(), _CountingLoad()
+        load.release.clear()
+        in_flight = asyncio.create_task(graph._cached("demo", ("k",), load))
+        while not load.calls:
+            await asyncio.sleep(0)
+        graph._invalidate("demo")
+        load.release.set()
+        stale = await in_flight
+        fresh = await graph._cached("demo", ("k",), load)
+        return stale, fresh, load.calls
+
+    stale, fresh, calls = asyncio.run(scenario())
+    assert stale is not fresh and calls == 2
+
+
+def test_list_projects_does_not_store_a_list_loaded_across_a_delete():
+    async def scenario():
+        graph = _graph()
+        release = asyncio.Event()
+        reads = 0
+
+        async def read(query, /, **params):
+            nonlocal reads
+            reads += 1
+            await release.wait()
+            return [{"project": "demo"}]
+
+        async def write(query, /, **params):
+            return [{"deleted": 1}]
+
+        graph._read, graph._write = read, write
+        in_flight = asyncio.create_task(graph.list_projects())
+        while not reads:
+            await asyncio.sleep(0)
+        await graph.delete_entity("a", "demo")
+        release.set()
+        await in_flight
+        await graph.list_projects()
+        return reads
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_apply_migration_invalidates_every_cached_project():
+    class MigrationSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute_read(self, *args):
+            return {"seq": 1, "cypher_up": "RETURN 1"}
+
+        async def execute_write(self, *args):
+            return None
+
+    async def scenario():
+        graph, load = _graph(), _CountingLoad()
+        graph._session = lambda **config: MigrationSession()
+        for project in ("demo", "other"):
+            await graph._cached(project, ("k",), load)
+        await graph.apply_migration("demo", 1)
+        for project in ("demo", "other"):
+            await graph._cached(project, ("k",), load)
+        return load.calls
+
+    assert asyncio.run(scenario()) == 4
+
+
+# ── Write coalescing ──────────────────────────────────────────────────
+
+class _FakeFlush:
+    """Records each flushed batch and echoes row ids back as results."""
+
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.batches: list[list[dict]] = []
+        self.fail_on = fail_on
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self, rows: list[dict]) -> list[dict]:
+        self.batches.append(rows)
+        await self.release.wait()
+        if any(row["id"] == self.fail_on for row in rows):
+            raise ValueError(f"bad row {self.fail_on}")
+        return [{"id": row["id"]} for row in rows]
+
+
+def _rows(*ids: str) -> list[dict]:
+    return [{"id": i} for i in ids]
+
+
+def test_coalescer_merges_concurrent_submissions_and_slices_results():
+    async def scenario():
+        flush = _FakeFlush()
+        coalescer = _WriteCoalescer(flush, flush_interval=0.05)
+        results = await asyncio.gather(
+            coalescer.submit(_rows("a1", "a2")),
+            coalescer.submit(_rows("b1")),
+            coalescer.submit(_rows("c1", "c2", "c3")),
+        )
+        await coalescer.close()
+        return flush, results
+
+    flush, results = asyncio.run(scenario())
+    assert len(flush.batches) == 1
+    assert results == [
+        [{"id": "a1"}, {"id": "a2"}],
+        [{"id": "b1"}],
+        [{"id": "c1"}, {"id": "c2"}, {"id": "c3"}],
+    ]
+
+
+def test_coalescer_flushes_once_max_batch_is_reached():
+    async def scenario():
+        flush = _FakeFlush()
+        coalescer = _WriteCoalescer(flush, flush_interval=10, max_batch=2)
+        # With a 10s window, only the batch limit can trigger these flushes.
+        results = await asyncio.wait_for(
+            asyncio.gather(*(coalescer.submit(_rows(str(i))) for i in range(4))), timeout=1
+        )
+        await coalescer.close()
+        return flush, results
+
+    flush, results = asyncio.run(scenario())
+    assert [len(batch) for batch in flush.batches] == [2, 2]
+    assert results == [[{"id": str(i)}] for i in range(4)]
+
+
+def test_coalescer_never_grows_a_batch_past_max_batch():
+    async def scenario():
+        flush = _FakeFlush()
+        coalescer = _WriteCoalescer(flush, flush_interval=0.05, max_batch=5)
+        sizes = (4, 5, 5, 1)
+        results = await asyncio.gather(
+            *(
+                coalescer.submit(_rows(*(f"{n}-{i}" for i in range(size))))
+                for n, size in enumerate(sizes)
+            )
+        )
+        await coalescer.close()
+        return flush, sizes, results
+
+    flush, sizes, results = asyncio.run(scenario())
+    assert [len(batch) for batch in flush.batches] == [4, 5, 5, 1]
+    assert [len(result) for result in results] == list(sizes)
+    assert results[1][0] == {"id": "1-0"}
+
+
+def test_coalescer_propagates_errors_to_every_caller_in_the_batch():
+    async def scenario():
+        flush = _FakeFlush(fail_on="bad")
+        coalescer = _WriteCoalescer(flush, flush_interval=0.05)
+        outcomes = await asyncio.gather(
+            coalescer.submit(_rows("ok")),
+            coalescer.submit(_rows("bad")),
+            return_exceptions=True,
+        )
+        # The coalescer keeps serving after a failed flush.
+        after = await coalescer.submit(_rows("later"))
+        await coalescer.close()
+        return outcomes, after
+
+    outcomes, after = asyncio.run(scenario())
+    assert all(isinstance(outcome, ValueError) for outcome in outcomes)
+    assert after == [{"id": "later"}]
+
+
+def test_coalescer_close_cancels_in_flight_and_queued_submissions():
+    async def scenario():
+        flush = _FakeFlush()
+        flush.release.clear()
+        coalescer = _WriteCoalescer(flush, flush_interval=0)
+        in_flight = asyncio.create_task(coalescer.submit(_rows("a")))
+        while not flush.batches:
+            await asyncio.sleep(0)
+        queued = asyncio.create_task(coalescer.submit(_rows("b")))
+        await asyncio.sleep(0)
+        await coalescer.close()
+        return await asyncio.gather(in_flight, queued, return_exceptions=True)
+
+    outcomes = asyncio.run(scenario())
+    assert all(isinstance(outcome, asyncio.CancelledError) for outcome in outcomes)
+
+
+def test_merge_entities_invalidates_projects_when_the_write_fails():
+    class FailingSession:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def execute_write(self, *args):
+            raise RuntimeError("write failed")
+
+    graph = _graph()
+    graph._session = lambda **config: FailingSession()
+    rows = _rows("x")
+    rows[0]["project"] = "demo"
+    with pytest.raises(RuntimeError):
+        asyncio.run(graph._merge_entities(rows))
+    assert graph._cache_versions["demo"] == 1
@@ -0,0 +1,14 @@
+"""Tests for the server's JSON output helpers."""
+
+from neo4j_knowledge_mcp import server
+
+
+def test_json_cached_reuses_output_only_for_the_same_result_object():
+    result = {"name": "a", "observations": ["x"]}
+    first = server._json_cached(("get_entity", "a", "demo"), result)
+    assert server._json_cached(("get_entity", "a", "demo"), result) is first
+
+    # An equal but new object means the graph cache reloaded it.
+    reloaded = {"name": "a", "observations": ["x"]}
+    again = server._json_cached(("get_entity", "a", "demo"), reloaded)
+    assert again == first and again is not first